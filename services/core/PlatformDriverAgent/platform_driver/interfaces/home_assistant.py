@@ -23,16 +23,20 @@
 # }}}
 
 
-import random
-from math import pi
-import json
-import sys
+from collections import defaultdict
+from types import MappingProxyType
 from platform_driver.interfaces import BaseInterface, BaseRegister, BasicRevert
-from volttron.platform.agent import utils
-from volttron.platform.vip.agent import Agent
 import logging
+import time
+from gevent.pool import Pool
 import requests
-from requests import get
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _log = logging.getLogger(__name__)
 type_mapping = {
@@ -44,6 +48,46 @@ type_mapping = {
     "boolean": bool,
 }
 
+# Home Assistant services (domain, action) the interface posts to.
+SERVICES = (
+    ("light", "turn_on"),
+    ("light", "turn_off"),
+    ("climate", "set_hvac_mode"),
+    ("climate", "set_temperature"),
+    ("input_boolean", "turn_on"),
+    ("input_boolean", "turn_off"),
+    ("fan", "turn_on"),
+    ("fan", "turn_off"),
+    ("fan", "set_percentage"),
+    ("switch", "turn_on"),
+    ("switch", "turn_off"),
+    ("cover", "open_cover"),
+    ("cover", "close_cover"),
+    ("cover", "stop_cover"),
+)
+
+# Numeric encodings of Home Assistant entity states.
+CLIMATE_STATE_MAP = {"off": 0, "heat": 2, "cool": 3, "auto": 4}
+ON_OFF_STATE_MAP = {"off": 0, "on": 1}
+COVER_STATE_MAP = {"closed": 0, "open": 1, "opening": 3, "closing": 4}
+CLIMATE_MODES = {code: mode for mode, code in CLIMATE_STATE_MAP.items()}
+
+# Values accepted by _set_point for state writes.
+ALLOWED_ON_OFF = frozenset((0, 1))
+ALLOWED_CLIMATE = frozenset(CLIMATE_MODES)
+ALLOWED_COVER = frozenset((0, 1, 2))
+
+# Shared read-only default for registry entries without "Attributes".
+EMPTY_ATTRIBUTES = MappingProxyType({})
+
+# HA domain -> state map used by get_point; other domains return the raw state.
+POINT_STATE_MAPS = {
+    "climate": CLIMATE_STATE_MAP,
+    "light": ON_OFF_STATE_MAP,
+    "input_boolean": ON_OFF_STATE_MAP,
+    "cover": COVER_STATE_MAP,
+}
+
 
 class HomeAssistantRegister(BaseRegister):
     def __init__(
@@ -68,22 +112,25 @@ class HomeAssistantRegister(BaseRegister):
         self.entity_point = entity_point
 
 
-def _post_method(url, headers, data, operation_description):
+def _post_method(session, url, headers, data, operation_description):
     """
     Shared helper for POST calls to the Home Assistant HTTP API.
     Logs and raises an error if the request fails.
     """
     err = None
     try:
-        response = requests.post(url, headers=headers, json=data)
-        if response.status_code == 200:
-            _log.info(f"Success: {operation_description}")
+        if orjson is None:
+            response = session.post(url, headers=headers, json=data)
         else:
-            err = (
-                f"Failed to {operation_description}. "
-                f"Status code: {response.status_code}. Response: {response.text}"
-            )
-
+            response = session.post(url, headers=headers, data=orjson.dumps(data))
+        response.raise_for_status()
+        _log.info(f"Success: {operation_description}")
+
+    except HTTPError as e:
+        err = (
+            f"Failed to {operation_description}. "
+            f"Status code: {e.response.status_code}. Response: {e.response.text}"
+        )
     except requests.RequestException as e:
         err = f"Error when attempting - {operation_description} : {e}"
 
@@ -92,6 +139,93 @@ def _post_method(url, headers, data, operation_description):
         raise Exception(err)
 
 
+def _fahrenheit_to_celsius(temperature):
+    return round((temperature - 32) * 5 / 9, 1)
+
+
+def _unconverted(temperature):
+    return temperature
+
+
+def _decode_json(response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _store_value(register, result, value):
+    register.value = value
+    result[register.point_name] = value
+
+
+def _scrape_attribute(register, attributes, result):
+    _store_value(register, result, attributes.get(register.entity_point, 0))
+
+
+def _scrape_climate(register, state, attributes, result):
+    if register.entity_point != "state":
+        _scrape_attribute(register, attributes, result)
+        return
+
+    code = CLIMATE_STATE_MAP.get(state)
+    if code is None:
+        error_msg = f"State {state} from {register.entity_id} is not yet supported"
+        _log.error(error_msg)
+        raise ValueError(error_msg)
+    _store_value(register, result, code)
+
+
+def _scrape_on_off(register, state, attributes, result):
+    if register.entity_point != "state":
+        _scrape_attribute(register, attributes, result)
+        return
+
+    code = ON_OFF_STATE_MAP.get(state)
+    if code is not None:
+        _store_value(register, result, code)
+
+
+def _scrape_cover(register, state, attributes, result):
+    if register.entity_point != "state":
+        _scrape_attribute(register, attributes, result)
+        return
+
+    code = COVER_STATE_MAP.get(state)
+    if code is None:
+        error_msg = f"State {state} from {register.entity_id} is not yet supported"
+        _log.error(error_msg)
+        raise ValueError(error_msg)
+    _store_value(register, result, code)
+
+
+def _scrape_generic(register, state, attributes, result):
+    # Generic entity:
+    # - state is returned as-is
+    # - attributes read from attributes dict
+    if register.entity_point == "state":
+        _store_value(register, result, state)
+    else:
+        _scrape_attribute(register, attributes, result)
+
+
+# HA domain -> scrape handler used by _scrape_all; other domains are
+# handled by _scrape_generic.
+SCRAPE_HANDLERS = {
+    "climate": _scrape_climate,
+    "light": _scrape_on_off,
+    "input_boolean": _scrape_on_off,
+    "fan": _scrape_on_off,
+    "switch": _scrape_on_off,
+    "cover": _scrape_cover,
+}
+
+# Domains _set_point knows how to write to.
+SET_DOMAINS = frozenset(("light", "input_boolean", "climate", "fan", "switch", "cover"))
+
+
 class Interface(BasicRevert, BaseInterface):
     """
     Home Assistant driver interface.
@@ -114,6 +248,26 @@ class Interface(BasicRevert, BaseInterface):
         self.access_token = None
         self.port = None
         self.units = None
+        self._headers = None
+        self._base_url = None
+        self._service_urls = {}
+        self._temp_to_ha = _unconverted
+        # entity_id -> (expires_at, entity data); disabled while _cache_ttl is 0
+        self._cache = {}
+        self._cache_ttl = 0
+        # Bumped by every write; entity_id -> generation of its last write.
+        # Reads started before a write to an entity must not cache it.
+        self._write_generation = 0
+        self._written_at = {}
+        # Cleared once Home Assistant rejects /api/states, so later scrapes
+        # go straight to per-entity requests; reset on configure.
+        self._bulk_states = True
+        # A single pooled session keeps the connection to Home Assistant
+        # alive between requests instead of reconnecting for every point.
+        self._session = requests.Session()
+        self._session.mount(
+            "http://", HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        )
 
     def configure(self, config_dict, registry_config_str):
         """
@@ -134,8 +288,40 @@ class Interface(BasicRevert, BaseInterface):
             _log.error("Port is not set.")
             raise ValueError("Port is required.")
 
+        cache_ttl = config_dict.get("cache_ttl", 0)
+        error_msg = (
+            f"cache_ttl must be a non-negative number of seconds, got {cache_ttl!r}."
+        )
+        try:
+            cache_ttl = float(cache_ttl)
+        except (TypeError, ValueError):
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+        # Written as "not >=" so that NaN is rejected too
+        if not cache_ttl >= 0:
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+        self._cache_ttl = cache_ttl
+        self._bulk_states = True
+
+        self._headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+        }
+        self._base_url = f"http://{self.ip_address}:{self.port}"
+        self._service_urls = {
+            (domain, action): f"{self._base_url}/api/services/{domain}/{action}"
+            for domain, action in SERVICES
+        }
+
         self.parse_config(registry_config_str)
 
+        # Registry units are known once parsed; pick the setpoint conversion now
+        if self.units == "C":
+            self._temp_to_ha = _fahrenheit_to_celsius
+        else:
+            self._temp_to_ha = _unconverted
+
     def get_point(self, point_name):
         """
         Read a single point from Home Assistant, using entity_id and entity_point
@@ -144,54 +330,20 @@ class Interface(BasicRevert, BaseInterface):
         register = self.get_register_by_name(point_name)
         entity_id = register.entity_id
         entity_point = register.entity_point
-        entity_id = register.entity_id
-        entity_point = register.entity_point
 
-        entity_data = self.get_entity_data(register.entity_id)
-        
-        if entity_point == "state":
-            state = entity_data.get("state", None)
-            
-            # Convert states to numeric values based on entity type
-            if "climate." in entity_id:
-                # Thermostat states
-                state_map = {"off": 0, "heat": 2, "cool": 3, "auto": 4}
-                return state_map.get(state, state)
-            elif "light." in entity_id or "input_boolean." in entity_id:
-                # Light/boolean states
-                state_map = {"off": 0, "on": 1}
-                return state_map.get(state, state)
-            elif "cover." in entity_id:
-                # Cover states
-                state_map = {"closed": 0, "open": 1, "opening": 3, "closing": 4}
-                return state_map.get(state, state)
-            else:
-                # Return raw state for unknown types
-                return state
-        
+        entity_data = self.get_entity_data(entity_id)
+
         if entity_point == "state":
             state = entity_data.get("state", None)
-            
-            # Convert states to numeric values based on entity type
-            if "climate." in entity_id:
-                # Thermostat states
-                state_map = {"off": 0, "heat": 2, "cool": 3, "auto": 4}
-                return state_map.get(state, state)
-            elif "light." in entity_id or "input_boolean." in entity_id:
-                # Light/boolean states
-                state_map = {"off": 0, "on": 1}
-                return state_map.get(state, state)
-            elif "cover." in entity_id:
-                # Cover states
-                state_map = {"closed": 0, "open": 1, "opening": 3, "closing": 4}
-                return state_map.get(state, state)
-            else:
-                # Return raw state for unknown types
+            # Convert states to numeric values based on entity type;
+            # unknown types return the raw state
+            state_map = POINT_STATE_MAPS.get(entity_id.partition(".")[0])
+            if state_map is None:
                 return state
+            return state_map.get(state, state)
         else:
-            value = entity_data.get("attributes", {}).get(f"{entity_point}", 0)
-            _log.info(f"Reading attribute: entity_id={entity_id}, entity_point={entity_point}, value={value}")
-            value = entity_data.get("attributes", {}).get(f"{entity_point}", 0)
+            attributes = entity_data.get("attributes") or EMPTY_ATTRIBUTES
+            value = attributes.get(entity_point, 0)
             _log.info(f"Reading attribute: entity_id={entity_id}, entity_point={entity_point}, value={value}")
             return value
 
@@ -199,13 +351,13 @@ class Interface(BasicRevert, BaseInterface):
         """
         Write a single point to Home Assistant.
 
-        The logic branches on HA domain:
+        The write is dispatched on the entity's HA domain and entity_point:
         - light.*: on/off and brightness
         - input_boolean.*: on/off
         - climate.*: hvac mode and temperature
         - fan.*: on/off and speed/percentage
         - switch.*: on/off
-        - cover.*: open/close and position
+        - cover.*: open/close/stop
         """
         register = self.get_register_by_name(point_name)
         if register.read_only:
@@ -215,180 +367,22 @@ class Interface(BasicRevert, BaseInterface):
 
         register.value = register.reg_type(value)
         entity_point = register.entity_point
+        domain = register.entity_id.partition(".")[0]
 
-        # ---- LIGHT ----
-        if register.entity_id.startswith("light."):
-            if entity_point == "state":
-                if isinstance(register.value, int) and register.value in [0, 1]:
-                    if register.value == 1:
-                        self.turn_on_lights(register.entity_id)
-                    elif register.value == 0:
-                        self.turn_off_lights(register.entity_id)
-                else:
-                    error_msg = (
-                        f"State value for {register.entity_id} "
-                        f"should be an integer value of 1 or 0"
-                    )
-                    _log.info(error_msg)
-                    raise ValueError(error_msg)
-
-            elif entity_point == "brightness":
-                # Brightness is 0–255 in Home Assistant
-                if isinstance(register.value, int) and 0 <= register.value <= 255:
-                    self.change_brightness(register.entity_id, register.value)
-                else:
-                    error_msg = (
-                        "Brightness value should be an integer between 0 and 255"
-                    )
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-
-            else:
-                error_msg = (
-                    f"Unexpected point_name {point_name} for register "
-                    f"{register.entity_id}"
-                )
-                _log.error(error_msg)
-                raise ValueError(error_msg)
-
-        # ---- INPUT BOOLEAN ----
-        elif register.entity_id.startswith("input_boolean."):
-            if entity_point == "state":
-                if isinstance(register.value, int) and register.value in [0, 1]:
-                    if register.value == 1:
-                        self.set_input_boolean(register.entity_id, "on")
-                    elif register.value == 0:
-                        self.set_input_boolean(register.entity_id, "off")
-                else:
-                    error_msg = (
-                        f"State value for {register.entity_id} "
-                        f"should be an integer value of 1 or 0"
-                    )
-                    _log.info(error_msg)
-                    raise ValueError(error_msg)
-            else:
-                _log.info("Currently, input_booleans only support state")
-
-        # ---- CLIMATE ----
-        elif register.entity_id.startswith("climate."):
-            if entity_point == "state":
-                # 0,2,3,4 used as numeric encoding for off/heat/cool/auto
-                if isinstance(register.value, int) and register.value in [0, 2, 3, 4]:
-                    if register.value == 0:
-                        self.change_thermostat_mode(
-                            entity_id=register.entity_id, mode="off"
-                        )
-                    elif register.value == 2:
-                        self.change_thermostat_mode(
-                            entity_id=register.entity_id, mode="heat"
-                        )
-                    elif register.value == 3:
-                        self.change_thermostat_mode(
-                            entity_id=register.entity_id, mode="cool"
-                        )
-                    elif register.value == 4:
-                        self.change_thermostat_mode(
-                            entity_id=register.entity_id, mode="auto"
-                        )
-                else:
-                    error_msg = (
-                        "Climate state should be an integer "
-                        "value of 0, 2, 3, or 4"
-                    )
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-
-            elif entity_point == "temperature":
-                self.set_thermostat_temperature(
-                    entity_id=register.entity_id, temperature=register.value
-                )
+        handler = self._SET_HANDLERS.get((domain, entity_point))
+        if handler is not None:
+            handler(self, register)
 
-            else:
-                error_msg = (
-                    "Currently set_point is supported only for "
-                    "thermostats state and temperature "
-                    f"{register.entity_id}"
-                )
-                _log.error(error_msg)
-                raise ValueError(error_msg)
-
-        # ---- FAN ----
-        elif register.entity_id.startswith("fan."):
-            if entity_point == "state":
-                if isinstance(register.value, int) and register.value in [0, 1]:
-                    if register.value == 1:
-                        self.turn_on_fan(register.entity_id)
-                    elif register.value == 0:
-                        self.turn_off_fan(register.entity_id)
-                else:
-                    error_msg = (
-                        f"State value for {register.entity_id} "
-                        f"should be an integer value of 1 or 0"
-                    )
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-
-            elif entity_point == "percentage":
-                # Fan percentage is typically 0–100
-                if isinstance(register.value, int) and 0 <= register.value <= 100:
-                    self.set_fan_speed(register.entity_id, register.value)
-                else:
-                    error_msg = (
-                        "Fan percentage should be an integer between 0 and 100"
-                    )
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
+        elif domain == "input_boolean":
+            _log.info("Currently, input_booleans only support state")
 
-            else:
-                error_msg = (
-                    f"Unexpected point_name {point_name} for fan "
-                    f"{register.entity_id}"
-                )
-                _log.error(error_msg)
-                raise ValueError(error_msg)
-
-        # ---- SWITCH ----
-        elif register.entity_id.startswith("switch."):
-            if entity_point == "state":
-                if isinstance(register.value, int) and register.value in [0, 1]:
-                    if register.value == 1:
-                        self.turn_on_switch(register.entity_id)
-                    elif register.value == 0:
-                        self.turn_off_switch(register.entity_id)
-                else:
-                    error_msg = (
-                        f"State value for {register.entity_id} "
-                        f"should be an integer value of 1 or 0"
-                    )
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-            else:
-                error_msg = (
-                    f"Unexpected point_name {point_name} for switch "
-                    f"{register.entity_id}"
-                )
-                _log.error(error_msg)
-                raise ValueError(error_msg)
-
-        # ---- COVER ----
-        elif "cover." in register.entity_id:
-            if entity_point == "state":
-                if isinstance(register.value, int) and register.value in [0, 1, 2]:
-                    if register.value == 0:
-                        self.close_cover(register.entity_id)
-                    elif register.value == 1:
-                        self.open_cover(register.entity_id)
-                    elif register.value == 2:
-                        self.stop_cover(register.entity_id)
-                else:
-                    error_msg = f"State value for {register.entity_id} should be an integer value of 0 (close), 1 (open), or 2 (stop)"
-                    _log.error(error_msg)
-                    raise ValueError(error_msg)
-
-            else:
-                error_msg = f"Unexpected point_name {point_name} for cover {register.entity_id}"
-                _log.error(error_msg)
-                raise ValueError(error_msg)
+        elif domain in SET_DOMAINS:
+            error_msg = (
+                f"Unexpected point_name {point_name} for {domain} "
+                f"{register.entity_id}"
+            )
+            _log.error(error_msg)
+            raise ValueError(error_msg)
 
         else:
             error_msg = (
@@ -399,21 +393,163 @@ class Interface(BasicRevert, BaseInterface):
             _log.error(error_msg)
             raise ValueError(error_msg)
 
+        # Make the write visible to the next read, including over a read
+        # already in flight in another greenlet
+        self._write_generation += 1
+        self._written_at[register.entity_id] = self._write_generation
+        self._cache.pop(register.entity_id, None)
         return register.value
 
+    def _set_light_state(self, register):
+        if isinstance(register.value, int) and register.value in ALLOWED_ON_OFF:
+            if register.value == 1:
+                self.turn_on_lights(register.entity_id)
+            elif register.value == 0:
+                self.turn_off_lights(register.entity_id)
+        else:
+            error_msg = (
+                f"State value for {register.entity_id} "
+                f"should be an integer value of 1 or 0"
+            )
+            _log.info(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_light_brightness(self, register):
+        # Brightness is 0–255 in Home Assistant
+        if isinstance(register.value, int) and 0 <= register.value <= 255:
+            self.change_brightness(register.entity_id, register.value)
+        else:
+            error_msg = "Brightness value should be an integer between 0 and 255"
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_input_boolean_state(self, register):
+        if isinstance(register.value, int) and register.value in ALLOWED_ON_OFF:
+            if register.value == 1:
+                self.set_input_boolean(register.entity_id, "on")
+            elif register.value == 0:
+                self.set_input_boolean(register.entity_id, "off")
+        else:
+            error_msg = (
+                f"State value for {register.entity_id} "
+                f"should be an integer value of 1 or 0"
+            )
+            _log.info(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_climate_state(self, register):
+        # 0,2,3,4 used as numeric encoding for off/heat/cool/auto
+        if isinstance(register.value, int) and register.value in ALLOWED_CLIMATE:
+            self.change_thermostat_mode(
+                entity_id=register.entity_id, mode=CLIMATE_MODES[register.value]
+            )
+        else:
+            error_msg = "Climate state should be an integer value of 0, 2, 3, or 4"
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_climate_temperature(self, register):
+        self.set_thermostat_temperature(
+            entity_id=register.entity_id, temperature=register.value
+        )
+
+    def _set_fan_state(self, register):
+        if isinstance(register.value, int) and register.value in ALLOWED_ON_OFF:
+            if register.value == 1:
+                self.turn_on_fan(register.entity_id)
+            elif register.value == 0:
+                self.turn_off_fan(register.entity_id)
+        else:
+            error_msg = (
+                f"State value for {register.entity_id} "
+                f"should be an integer value of 1 or 0"
+            )
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_fan_percentage(self, register):
+        # Fan percentage is typically 0–100
+        if isinstance(register.value, int) and 0 <= register.value <= 100:
+            self.set_fan_speed(register.entity_id, register.value)
+        else:
+            error_msg = "Fan percentage should be an integer between 0 and 100"
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_switch_state(self, register):
+        if isinstance(register.value, int) and register.value in ALLOWED_ON_OFF:
+            if register.value == 1:
+                self.turn_on_switch(register.entity_id)
+            elif register.value == 0:
+                self.turn_off_switch(register.entity_id)
+        else:
+            error_msg = (
+                f"State value for {register.entity_id} "
+                f"should be an integer value of 1 or 0"
+            )
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+
+    def _set_cover_state(self, register):
+        if isinstance(register.value, int) and register.value in ALLOWED_COVER:
+            if register.value == 0:
+                self.close_cover(register.entity_id)
+            elif register.value == 1:
+                self.open_cover(register.entity_id)
+            elif register.value == 2:
+                self.stop_cover(register.entity_id)
+        else:
+            error_msg = (
+                f"State value for {register.entity_id} should be an integer "
+                "value of 0 (close), 1 (open), or 2 (stop)"
+            )
+            _log.error(error_msg)
+            raise ValueError(error_msg)
+
+    # (domain, entity_point) -> write handler used by _set_point
+    _SET_HANDLERS = {
+        ("light", "state"): _set_light_state,
+        ("light", "brightness"): _set_light_brightness,
+        ("input_boolean", "state"): _set_input_boolean_state,
+        ("climate", "state"): _set_climate_state,
+        ("climate", "temperature"): _set_climate_temperature,
+        ("fan", "state"): _set_fan_state,
+        ("fan", "percentage"): _set_fan_percentage,
+        ("switch", "state"): _set_switch_state,
+        ("cover", "state"): _set_cover_state,
+    }
+
+    def _call_service(self, domain, action, payload, operation_description):
+        """
+        POST a payload to a Home Assistant service using the precomputed URL.
+        """
+        _post_method(
+            self._session,
+            self._service_urls[domain, action],
+            self._headers,
+            payload,
+            operation_description,
+        )
+
     def get_entity_data(self, point_name):
         """
         Retrieve the raw state + attributes payload for an entity from Home Assistant.
+
+        When cache_ttl is configured, payloads fetched within the last
+        cache_ttl seconds are returned without another request. A payload
+        is not cached if the entity was written while it was being fetched.
         """
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-        url = f"http://{self.ip_address}:{self.port}/api/states/{point_name}"
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()
-        else:
+        if self._cache_ttl > 0:
+            cached = self._cache.get(point_name)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+
+        generation = self._write_generation
+        url = f"{self._base_url}/api/states/{point_name}"
+        response = self._session.get(url, headers=self._headers)
+        try:
+            response.raise_for_status()
+        except HTTPError:
             error_msg = (
                 f"Request failed with status code {response.status_code}, "
                 f"Point name: {point_name}, response: {response.text}"
@@ -421,6 +557,57 @@ class Interface(BasicRevert, BaseInterface):
             _log.error(error_msg)
             raise Exception(error_msg)
 
+        entity_data = _decode_json(response)
+        if self._cache_ttl > 0 and self._written_at.get(point_name, 0) <= generation:
+            self._cache[point_name] = (time.monotonic() + self._cache_ttl, entity_data)
+        return entity_data
+
+    def _fetch_entity_data(self, entity_id):
+        """
+        get_entity_data for use in a greenlet pool: errors are logged and
+        reported as None instead of being raised.
+        """
+        try:
+            return self.get_entity_data(entity_id)
+        except Exception as e:
+            _log.error(f"An unexpected error occurred for entity_id: {entity_id}: {e}")
+            return None
+
+    def get_all_entity_data(self, entity_ids):
+        """
+        Retrieve the state + attributes payload for the given entities in a
+        single request, keyed by entity_id. Entities Home Assistant does not
+        report are left out. An error response marks the bulk endpoint as
+        unavailable until the interface is reconfigured.
+        """
+        generation = self._write_generation
+        url = f"{self._base_url}/api/states"
+        response = self._session.get(url, headers=self._headers)
+        try:
+            response.raise_for_status()
+        except HTTPError:
+            self._bulk_states = False
+            raise Exception(
+                f"Request failed with status code {response.status_code}, "
+                f"response: {response.text}"
+            )
+
+        # /api/states covers the whole installation; keep only the entities
+        # this device reads so neither the result nor the cache hold the rest.
+        all_states = {
+            entity["entity_id"]: entity
+            for entity in _decode_json(response)
+            if entity["entity_id"] in entity_ids
+        }
+        if self._cache_ttl > 0:
+            expires_at = time.monotonic() + self._cache_ttl
+            self._cache = {
+                entity_id: (expires_at, entity_data)
+                for entity_id, entity_data in all_states.items()
+                if self._written_at.get(entity_id, 0) <= generation
+            }
+        return all_states
+
     def _scrape_all(self):
         """
         Scrape all configured registers and return a dictionary mapping
@@ -430,169 +617,52 @@ class Interface(BasicRevert, BaseInterface):
         read_registers = self.get_registers_by_type("byte", True)
         write_registers = self.get_registers_by_type("byte", False)
 
+        # Several registers commonly share one entity; fetch each entity once.
+        registers_by_entity = defaultdict(list)
         for register in read_registers + write_registers:
-            entity_id = register.entity_id
-            entity_point = register.entity_point
-            try:
-                entity_data = self.get_entity_data(entity_id)
-
-                # ---- CLIMATE ----
-                if entity_id.startswith("climate."):
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        # Map thermostat string states to numeric codes
-                        if state == "off":
-                            register.value = 0
-                            result[register.point_name] = 0
-                        elif state == "heat":
-                            register.value = 2
-                            result[register.point_name] = 2
-                        elif state == "cool":
-                            register.value = 3
-                            result[register.point_name] = 3
-                        elif state == "auto":
-                            register.value = 4
-                            result[register.point_name] = 4
-                        else:
-                            error_msg = (
-                                f"State {state} from {entity_id} is not yet supported"
-                            )
-                            _log.error(error_msg)
-                            raise ValueError(error_msg)
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(
-                            f"{entity_point}", 0
-                        )
-                        register.value = attribute
-                        result[register.point_name] = attribute
-
-                # ---- LIGHT / INPUT_BOOLEAN ----
-                elif entity_id.startswith("light.") or entity_id.startswith(
-                    "input_boolean."
-                ):
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        # Map on/off to 1/0
-                        if state == "on":
-                            register.value = 1
-                            result[register.point_name] = 1
-                        elif state == "off":
-                            register.value = 0
-                            result[register.point_name] = 0
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(
-                            f"{entity_point}", 0
-                        )
-                        register.value = attribute
-                        result[register.point_name] = attribute
-
-                # ---- FAN ----
-                elif entity_id.startswith("fan."):
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        if state == "on":
-                            register.value = 1
-                            result[register.point_name] = 1
-                        elif state == "off":
-                            register.value = 0
-                            result[register.point_name] = 0
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(
-                            f"{entity_point}", 0
-                        )
-                        register.value = attribute
-                        result[register.point_name] = attribute
-
-                # ---- SWITCH ----
-                elif entity_id.startswith("switch."):
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        if state == "on":
-                            register.value = 1
-                            result[register.point_name] = 1
-                        elif state == "off":
-                            register.value = 0
-                            result[register.point_name] = 0
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(
-                            f"{entity_point}", 0
-                        )
-                        register.value = attribute
-                        result[register.point_name] = attribute
-
-                # ---- COVER ----
-                elif "cover." in entity_id:
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        if state == "closed":
-                            register.value = 0
-                            result[register.point_name] = 0
-                        elif state == "open":
-                            register.value = 1
-                            result[register.point_name] = 1
-                        elif state == "opening":
-                            register.value = 3
-                            result[register.point_name] = 3
-                        elif state == "closing":
-                            register.value = 4
-                            result[register.point_name] = 4
-                        else:
-                            error_msg = f"State {state} from {entity_id} is not yet supported"
-                            _log.error(error_msg)
-                            raise ValueError(error_msg)
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(f"{entity_point}", 0)
-                        register.value = attribute
-                        result[register.point_name] = attribute
-
-
-                
-                else:  # handling all devices that are not thermostats or light states or covers
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        # Map cover states to numeric codes
-                        # Open/opening -> 1, closed/closing -> 0
-                        if state in ("open", "opening"):
-                            register.value = 1
-                            result[register.point_name] = 1
-                        elif state in ("closed", "closing"):
-                            register.value = 0
-                            result[register.point_name] = 0
-                        else:
-                            # Unknown state – leave at 0 but log
-                            _log.warning(
-                                f"Unsupported cover state {state} from {entity_id}"
-                            )
-                            register.value = 0
-                            result[register.point_name] = 0
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(
-                            f"{entity_point}", 0
-                        )
-                        register.value = attribute
-                        result[register.point_name] = attribute
-
-                # ---- DEFAULT FALLBACK ----
-                else:
-                    # Generic entity:
-                    # - state is returned as-is
-                    # - attributes read from attributes dict
-                    if entity_point == "state":
-                        state = entity_data.get("state", None)
-                        register.value = state
-                        result[register.point_name] = state
-                    else:
-                        attribute = entity_data.get("attributes", {}).get(
-                            f"{entity_point}", 0
-                        )
-                        register.value = attribute
-                        result[register.point_name] = attribute
+            registers_by_entity[register.entity_id].append(register)
 
+        # One bulk request for every entity; individual requests are only
+        # made below for entities missing from the bulk response.
+        all_states = {}
+        if self._bulk_states:
+            try:
+                all_states = self.get_all_entity_data(registers_by_entity.keys())
             except Exception as e:
-                _log.error(
-                    f"An unexpected error occurred for entity_id: {entity_id}: {e}"
+                _log.warning(
+                    f"Bulk state request failed, falling back to per-entity requests: {e}"
                 )
 
+        missing = [
+            entity_id
+            for entity_id in registers_by_entity
+            if entity_id not in all_states
+        ]
+        if missing:
+            # Overlap the per-entity requests in greenlets on the session's
+            # connection pool; the driver already runs on the gevent hub.
+            pool = Pool(min(len(missing), 16))
+            for entity_id, entity_data in zip(
+                missing, pool.imap(self._fetch_entity_data, missing)
+            ):
+                if entity_data is not None:
+                    all_states[entity_id] = entity_data
+
+        for entity_id, registers in registers_by_entity.items():
+            entity_data = all_states.get(entity_id)
+            if entity_data is None:
+                continue
+            handler = SCRAPE_HANDLERS.get(entity_id.partition(".")[0], _scrape_generic)
+            state = entity_data.get("state")
+            attributes = entity_data.get("attributes") or EMPTY_ATTRIBUTES
+            for register in registers:
+                try:
+                    handler(register, state, attributes, result)
+                except Exception as e:
+                    _log.error(
+                        f"An unexpected error occurred for entity_id: {entity_id}: {e}"
+                    )
+
         return result
 
     def parse_config(self, config_dict):
@@ -614,8 +684,8 @@ class Interface(BasicRevert, BaseInterface):
             description = regDef.get("Notes", "")
             default_value = "Starting Value"
             type_name = regDef.get("Type", "string")
-            reg_type = type_mapping.get(type_name, str)
-            attributes = regDef.get("Attributes", {})
+            reg_type = type_mapping.get(type_name.lower(), str)
+            attributes = regDef.get("Attributes", EMPTY_ATTRIBUTES)
             register_type = HomeAssistantRegister
 
             register = register_type(
@@ -638,35 +708,21 @@ class Interface(BasicRevert, BaseInterface):
     # --------------------------- LIGHT HELPERS ---------------------------
 
     def turn_off_lights(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/light/turn_off"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
         payload = {"entity_id": entity_id}
-        _post_method(url, headers, payload, f"turn off {entity_id}")
+        self._call_service("light", "turn_off", payload, f"turn off {entity_id}")
 
     def turn_on_lights(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/light/turn_on"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {"entity_id": f"{entity_id}"}
-        _post_method(url, headers, payload, f"turn on {entity_id}")
+        payload = {"entity_id": entity_id}
+        self._call_service("light", "turn_on", payload, f"turn on {entity_id}")
 
     def change_brightness(self, entity_id, value):
         """
         Set brightness for a light (0–255).
         """
-        url = f"http://{self.ip_address}:{self.port}/api/services/light/turn_on"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-        payload = {"entity_id": f"{entity_id}", "brightness": value}
-        _post_method(url, headers, payload, f"set brightness of {entity_id} to {value}")
+        payload = {"entity_id": entity_id, "brightness": value}
+        self._call_service(
+            "light", "turn_on", payload, f"set brightness of {entity_id} to {value}"
+        )
 
     # ------------------------ CLIMATE HELPERS ---------------------------
 
@@ -675,35 +731,20 @@ class Interface(BasicRevert, BaseInterface):
             _log.error(f"{entity_id} is not a valid thermostat entity ID.")
             return
 
-        url = f"http://{self.ip_address}:{self.port}/api/services/climate/set_hvac_mode"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "content-type": "application/json",
-        }
         data = {"entity_id": entity_id, "hvac_mode": mode}
-        _post_method(url, headers, data, f"change mode of {entity_id} to {mode}")
+        self._call_service(
+            "climate", "set_hvac_mode", data, f"change mode of {entity_id} to {mode}"
+        )
 
     def set_thermostat_temperature(self, entity_id, temperature):
         if not entity_id.startswith("climate."):
             _log.error(f"{entity_id} is not a valid thermostat entity ID.")
             return
 
-        url = f"http://{self.ip_address}:{self.port}/api/services/climate/set_temperature"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "content-type": "application/json",
-        }
-
-        if self.units == "C":
-            converted_temp = round((temperature - 32) * 5 / 9, 1)
-            _log.info(f"Converted temperature {converted_temp}")
-            data = {"entity_id": entity_id, "temperature": converted_temp}
-        else:
-            data = {"entity_id": entity_id, "temperature": temperature}
-
-        _post_method(
-            url,
-            headers,
+        data = {"entity_id": entity_id, "temperature": self._temp_to_ha(temperature)}
+        self._call_service(
+            "climate",
+            "set_temperature",
             data,
             f"set temperature of {entity_id} to {temperature}",
         )
@@ -715,59 +756,29 @@ class Interface(BasicRevert, BaseInterface):
         Set an input_boolean to on/off.
         """
         service = "turn_on" if state == "on" else "turn_off"
-        url = (
-            f"http://{self.ip_address}:{self.port}/api/services/input_boolean/{service}"
-        )
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-
         payload = {"entity_id": entity_id}
-
-        response = requests.post(url, headers=headers, json=payload)
-
-        if response.status_code == 200:
-            _log.info(f"Successfully set {entity_id} to {state}")
-        else:
-            _log.error(
-                f"Failed to set {entity_id} to {state}: {response.status_code} "
-                f"{response.text}"
-            )
+        self._call_service(
+            "input_boolean", service, payload, f"set {entity_id} to {state}"
+        )
 
     # --------------------------- FAN HELPERS ----------------------------
 
     def turn_on_fan(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/fan/turn_on"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {"entity_id": f"{entity_id}"}
-        _post_method(url, headers, payload, f"turn on {entity_id}")
+        payload = {"entity_id": entity_id}
+        self._call_service("fan", "turn_on", payload, f"turn on {entity_id}")
 
     def turn_off_fan(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/fan/turn_off"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {"entity_id": f"{entity_id}"}
-        _post_method(url, headers, payload, f"turn off {entity_id}")
+        payload = {"entity_id": entity_id}
+        self._call_service("fan", "turn_off", payload, f"turn off {entity_id}")
 
     def set_fan_speed(self, entity_id, speed):
         """
         Set fan speed as percentage (0–100).
         """
-        url = f"http://{self.ip_address}:{self.port}/api/services/fan/set_speed"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-        payload = {"entity_id": entity_id, "speed": speed}
-        _post_method(url, headers, payload, f"set speed of {entity_id} to {speed}")
+        payload = {"entity_id": entity_id, "percentage": speed}
+        self._call_service(
+            "fan", "set_percentage", payload, f"set speed of {entity_id} to {speed}"
+        )
 
     # -------------------------- SWITCH HELPERS --------------------------
 
@@ -775,58 +786,27 @@ class Interface(BasicRevert, BaseInterface):
         """
         Turn on a switch device.
         """
-        url = f"http://{self.ip_address}:{self.port}/api/services/switch/turn_on"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
         payload = {"entity_id": entity_id}
-        _post_method(url, headers, payload, f"turn on switch {entity_id}")
+        self._call_service("switch", "turn_on", payload, f"turn on switch {entity_id}")
 
     def turn_off_switch(self, entity_id):
         """
         Turn off a switch device.
         """
-        url = f"http://{self.ip_address}:{self.port}/api/services/switch/turn_off"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
         payload = {"entity_id": entity_id}
-        _post_method(url, headers, payload, f"turn off switch {entity_id}")
+        self._call_service(
+            "switch", "turn_off", payload, f"turn off switch {entity_id}"
+        )
 
     # --------------------------- COVER HELPERS --------------------------
     def open_cover(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/cover/open_cover"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "entity_id": entity_id,
-        }
-        _post_method(url, headers, payload, f"open cover {entity_id}")
+        payload = {"entity_id": entity_id}
+        self._call_service("cover", "open_cover", payload, f"open cover {entity_id}")
 
     def close_cover(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/cover/close_cover"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "entity_id": entity_id,
-        }
-        _post_method(url, headers, payload, f"close cover {entity_id}")
+        payload = {"entity_id": entity_id}
+        self._call_service("cover", "close_cover", payload, f"close cover {entity_id}")
 
     def stop_cover(self, entity_id):
-        url = f"http://{self.ip_address}:{self.port}/api/services/cover/stop_cover"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "entity_id": entity_id,
-        }
-        _post_method(url, headers, payload, f"stop cover {entity_id}")
-
-    
+        payload = {"entity_id": entity_id}
+        self._call_service("cover", "stop_cover", payload, f"stop cover {entity_id}")